@@ -55,27 +55,20 @@ pub fn aggregate_group(samples: &[Sample]) -> anyhow::Result<Sample> {
         health_pct = avg_or_none(samples.iter().map(|s| s.health_pct));
     }
 
-    let mut statuses: BTreeSet<String> = BTreeSet::new();
-    for status in samples.iter().filter_map(|s| s.status.as_ref()) {
-        statuses.insert(status.to_string());
-    }
+    let statuses: BTreeSet<&str> = samples.iter().filter_map(|s| s.status.as_deref()).collect();
     let status = if statuses.is_empty() {
         None
     } else if statuses.len() == 1 {
-        Some(statuses.into_iter().next().unwrap())
+        statuses.into_iter().next().map(str::to_string)
     } else {
         Some("mixed".to_string())
     };
 
-    let mut sources: Vec<String> = samples
+    let mut sources: Vec<&str> = samples
         .iter()
-        .filter_map(|s| {
-            Path::new(&s.source_path)
-                .file_name()
-                .map(|p| p.to_string_lossy().into_owned())
-        })
+        .filter_map(|s| Path::new(&s.source_path).file_name()?.to_str())
         .collect();
-    sources.sort();
+    sources.sort_unstable();
     sources.dedup();
     let source_path = sources.join("+");
 
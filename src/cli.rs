@@ -2,6 +2,7 @@ use std::collections::BTreeMap;
 use std::ffi::OsString;
 use std::io::Write;
 use std::path::PathBuf;
+use std::sync::Once;
 
 use anyhow::Result;
 use clap::{Parser, Subcommand, ValueEnum};
@@ -9,12 +10,12 @@ use comfy_table::modifiers::UTF8_ROUND_CORNERS;
 use comfy_table::presets::UTF8_FULL_CONDENSED;
 use comfy_table::{Attribute, Cell, CellAlignment, Color, ContentArrangement, Table};
 
-use chrono::{DateTime, Local};
+use chrono::{Datelike, Local, TimeZone, Timelike};
 
 use crate::aggregate::aggregate_samples_by_timestamp;
 use crate::cli_helpers::{
-    average_rates, bucket_span_seconds, bucket_start, default_graph_path, estimate_runtime_hours,
-    format_runtime,
+    average_rates, bucket_span_seconds, bucket_start_epoch, default_graph_path,
+    estimate_runtime_hours, format_runtime, AverageRates, NumberStats,
 };
 use crate::collector::{collect_loop, collect_once, resolve_db_path};
 use crate::db::{self, Sample};
@@ -97,15 +98,19 @@ pub enum Commands {
     },
 }
 
+static LOGGING: Once = Once::new();
+
 fn configure_logging(verbose: bool) {
-    let mut builder = env_logger::Builder::from_env(env_logger::Env::default());
-    builder.format(|buf, record| writeln!(buf, "{}", record.args()));
-    if verbose {
-        builder.filter_level(log::LevelFilter::Debug);
-    } else {
-        builder.filter_level(log::LevelFilter::Info);
-    }
-    let _ = builder.try_init();
+    LOGGING.call_once(|| {
+        let mut builder = env_logger::Builder::from_env(env_logger::Env::default());
+        builder.format(|buf, record| writeln!(buf, "{}", record.args()));
+        if verbose {
+            builder.filter_level(log::LevelFilter::Debug);
+        } else {
+            builder.filter_level(log::LevelFilter::Info);
+        }
+        let _ = builder.try_init();
+    });
 }
 
 fn normalize_presets(mut presets: Vec<ReportPreset>) -> Vec<ReportPreset> {
@@ -199,23 +204,21 @@ where
             let presets = normalize_presets(presets);
             let metric_kinds = metric_kinds_for_presets(&presets);
 
-            let battery_total = db::count_samples(&resolved, None)?;
-            let metric_total = db::count_metric_samples(&resolved, None)?;
-            if battery_total == 0 && metric_total == 0 {
+            if !db::has_records(&resolved)? {
                 println!("No records available; collect data first.");
                 std::process::exit(1);
             }
 
             let since_ts = timeframe.since_timestamp(None);
-            let raw_samples =
-                if presets.contains(&ReportPreset::Battery) || graph_flag || graph_path.is_some() {
-                    db::fetch_samples(&resolved, since_ts)?
-                } else {
-                    Vec::new()
-                };
-            let metric_samples =
-                db::fetch_metric_samples(&resolved, since_ts, Some(&metric_kinds))?;
-            let metric_samples = filter_metrics_by_source(&metric_samples, &sensor_filters);
+            let raw_samples = if presets.contains(&ReportPreset::Battery) {
+                db::fetch_samples(&resolved, since_ts)?
+            } else {
+                Vec::new()
+            };
+            let metric_samples = filter_metrics_by_source(
+                db::fetch_metric_samples(&resolved, since_ts, Some(&metric_kinds))?,
+                &sensor_filters,
+            );
             let timeframe_record_count = raw_samples.len();
             let samples = aggregate_samples_by_timestamp(&raw_samples);
             let has_selected_data = presets
@@ -243,18 +246,7 @@ where
                 if samples.is_empty() && metric_samples.is_empty() {
                     println!("Skipping graph output; no data in timeframe.");
                 } else {
-                    let battery_for_plot: &[Sample] = if presets.contains(&ReportPreset::Battery) {
-                        &samples
-                    } else {
-                        &[]
-                    };
-                    graph::render_plot(
-                        battery_for_plot,
-                        &metric_samples,
-                        &presets,
-                        &timeframe,
-                        &path,
-                    )?;
+                    graph::render_plot(&samples, &metric_samples, &presets, &timeframe, &path)?;
                 }
             }
 
@@ -280,17 +272,14 @@ fn summarize(
     let timeframe_label = timeframe.label.replace('_', " ");
     let bucket_seconds =
         bucket_span_seconds(timeframe, data_span_seconds(timeframe_samples, metrics));
-    let battery_rates = average_rates(timeframe_samples);
-    let power_draw_stats = average_for_kind(metrics, MetricKind::PowerDraw);
-    let avg_discharge_w = power_draw_stats.average().or(battery_rates.discharge_w);
-    let est_runtime_hours = timeframe_samples
-        .last()
-        .and_then(|sample| estimate_runtime_hours(avg_discharge_w, sample));
-    let power_draw_by_bucket =
-        bucket_stats_for_kind(metrics, MetricKind::PowerDraw, bucket_seconds);
-    let network_rates = compute_network_rates(metrics);
 
     if presets.contains(&ReportPreset::Battery) {
+        let battery_rates = average_rates(timeframe_samples);
+        let power_draw_stats = average_for_kind(metrics, MetricKind::PowerDraw);
+        let avg_discharge_w = power_draw_stats.average().or(battery_rates.discharge_w);
+        let est_runtime_hours = timeframe_samples
+            .last()
+            .and_then(|sample| estimate_runtime_hours(avg_discharge_w, sample));
         println!(
             "\nBattery summary ({})\n{}",
             timeframe_label,
@@ -305,6 +294,8 @@ fn summarize(
         if timeframe_samples.is_empty() {
             println!("\nNo battery samples available for buckets in {timeframe_label}.");
         } else {
+            let power_draw_by_bucket =
+                bucket_stats_for_kind(metrics, MetricKind::PowerDraw, bucket_seconds);
             println!(
                 "\nBattery stats ({})\n{}",
                 timeframe.label.replace('_', " "),
@@ -372,6 +363,7 @@ fn summarize(
     }
 
     if presets.contains(&ReportPreset::Network) {
+        let network_rates = compute_network_rates(metrics);
         let network_buckets = bucket_network_rates(&network_rates, bucket_seconds);
         if network_buckets.is_empty() {
             println!("\nNo network samples available for {timeframe_label}.");
@@ -431,7 +423,7 @@ fn label_cell(text: &str) -> Cell {
 }
 
 fn value_cell<T: std::fmt::Display>(value: T) -> Cell {
-    Cell::new(value.to_string()).set_alignment(CellAlignment::Right)
+    Cell::new(value).set_alignment(CellAlignment::Right)
 }
 
 fn status_cell(status: Option<&str>) -> Cell {
@@ -457,44 +449,10 @@ fn format_rate(value: Option<f64>) -> String {
         .unwrap_or_else(|| "--".to_string())
 }
 
-#[derive(Default, Clone)]
-struct NumberStats {
-    total: f64,
-    count: usize,
-    min: f64,
-    max: f64,
-}
-
-impl NumberStats {
-    fn record(&mut self, value: f64) {
-        if self.count == 0 {
-            self.min = value;
-            self.max = value;
-        } else {
-            self.min = self.min.min(value);
-            self.max = self.max.max(value);
-        }
-        self.total += value;
-        self.count += 1;
-    }
-
-    fn record_opt(&mut self, value: Option<f64>) {
-        if let Some(v) = value {
-            self.record(v);
-        }
-    }
-
-    fn average(&self) -> Option<f64> {
-        (self.count > 0).then_some(self.total / self.count as f64)
-    }
-
-    fn min(&self) -> Option<f64> {
-        (self.count > 0).then_some(self.min)
-    }
-
-    fn max(&self) -> Option<f64> {
-        (self.count > 0).then_some(self.max)
-    }
+fn format_temperature(value: Option<f64>) -> String {
+    value
+        .map(|v| format!("{v:.1}C"))
+        .unwrap_or_else(|| "--".to_string())
 }
 
 #[derive(Default, Clone)]
@@ -538,20 +496,45 @@ fn average_for_kind(metrics: &[MetricSample], kind: MetricKind) -> NumberStats {
 }
 
 fn filter_metrics_by_source(
-    metrics: &[MetricSample],
+    mut metrics: Vec<MetricSample>,
     sensor_filters: &[String],
 ) -> Vec<MetricSample> {
-    if sensor_filters.is_empty() {
-        return metrics.to_vec();
+    if !sensor_filters.is_empty() {
+        metrics.retain(|m| sensor_filters.iter().any(|f| f == &m.source));
     }
     metrics
-        .iter()
-        .filter(|m| sensor_filters.iter().any(|f| f == &m.source))
-        .cloned()
-        .collect()
 }
 
-type SourceBuckets = BTreeMap<String, BTreeMap<DateTime<Local>, NumberStats>>;
+type SourceBuckets = BTreeMap<String, BTreeMap<i64, NumberStats>>;
+
+/// Bucket stats kept sorted by bucket start.
+type Buckets<T> = Vec<(i64, T)>;
+
+fn bucket_entry<T: Default>(buckets: &mut Buckets<T>, key: i64) -> &mut T {
+    // Metrics arrive ordered by ts, so the key almost always matches or follows the last bucket.
+    let idx = match buckets.last().map(|(last, _)| *last) {
+        Some(last) if last == key => buckets.len() - 1,
+        Some(last) if last > key => match buckets.binary_search_by_key(&key, |(k, _)| *k) {
+            Ok(idx) => idx,
+            Err(idx) => {
+                buckets.insert(idx, (key, T::default()));
+                idx
+            }
+        },
+        _ => {
+            buckets.push((key, T::default()));
+            buckets.len() - 1
+        }
+    };
+    &mut buckets[idx].1
+}
+
+fn bucket_get<T>(buckets: &[(i64, T)], key: i64) -> Option<&T> {
+    buckets
+        .binary_search_by_key(&key, |(k, _)| *k)
+        .ok()
+        .map(|idx| &buckets[idx].1)
+}
 
 fn bucket_stats_for_kind_by_source(
     metrics: &[MetricSample],
@@ -561,7 +544,7 @@ fn bucket_stats_for_kind_by_source(
     let mut buckets: SourceBuckets = BTreeMap::new();
     for sample in metrics.iter().filter(|s| s.kind == kind) {
         if let Some(value) = sample.value {
-            let bucket = bucket_start(sample.ts, bucket_seconds);
+            let bucket = bucket_start_epoch(sample.ts, bucket_seconds);
             buckets
                 .entry(sample.source.clone())
                 .or_default()
@@ -597,12 +580,12 @@ fn bucket_stats_for_kind(
     metrics: &[MetricSample],
     kind: MetricKind,
     bucket_seconds: i64,
-) -> BTreeMap<DateTime<Local>, NumberStats> {
-    let mut buckets: BTreeMap<DateTime<Local>, NumberStats> = BTreeMap::new();
+) -> Buckets<NumberStats> {
+    let mut buckets: Buckets<NumberStats> = Vec::new();
     for sample in metrics.iter().filter(|s| s.kind == kind) {
         if let Some(value) = sample.value {
-            let bucket = bucket_start(sample.ts, bucket_seconds);
-            buckets.entry(bucket).or_default().record(value);
+            let bucket = bucket_start_epoch(sample.ts, bucket_seconds);
+            bucket_entry(&mut buckets, bucket).record(value);
         }
     }
     buckets
@@ -622,15 +605,12 @@ fn bucket_usage_stats(
     metrics: &[MetricSample],
     kind: MetricKind,
     bucket_seconds: i64,
-) -> BTreeMap<DateTime<Local>, UsageStats> {
-    let mut buckets: BTreeMap<DateTime<Local>, UsageStats> = BTreeMap::new();
+) -> Buckets<UsageStats> {
+    let mut buckets: Buckets<UsageStats> = Vec::new();
     for sample in metrics.iter().filter(|s| s.kind == kind) {
-        let bucket = bucket_start(sample.ts, bucket_seconds);
+        let bucket = bucket_start_epoch(sample.ts, bucket_seconds);
         let total = number_from_details(sample, "total_bytes");
-        buckets
-            .entry(bucket)
-            .or_default()
-            .record(sample.value, total);
+        bucket_entry(&mut buckets, bucket).record(sample.value, total);
     }
     buckets
 }
@@ -690,17 +670,11 @@ fn compute_network_rates(metrics: &[MetricSample]) -> Vec<NetworkRateSample> {
     rates
 }
 
-fn bucket_network_rates(
-    rates: &[NetworkRateSample],
-    bucket_seconds: i64,
-) -> BTreeMap<DateTime<Local>, RateStats> {
-    let mut buckets: BTreeMap<DateTime<Local>, RateStats> = BTreeMap::new();
+fn bucket_network_rates(rates: &[NetworkRateSample], bucket_seconds: i64) -> Buckets<RateStats> {
+    let mut buckets: Buckets<RateStats> = Vec::new();
     for rate in rates {
-        let bucket = bucket_start(rate.ts, bucket_seconds);
-        buckets
-            .entry(bucket)
-            .or_default()
-            .record(rate.rx_rate, rate.tx_rate);
+        let bucket = bucket_start_epoch(rate.ts, bucket_seconds);
+        bucket_entry(&mut buckets, bucket).record(rate.rx_rate, rate.tx_rate);
     }
     buckets
 }
@@ -738,17 +712,59 @@ fn battery_summary_table(
     table
 }
 
+struct BatteryBucketStats<'a> {
+    start: i64,
+    records: usize,
+    percent: NumberStats,
+    latest_status: Option<&'a str>,
+    rates: AverageRates,
+}
+
+fn battery_bucket_stats(samples: &[Sample], bucket_seconds: i64) -> Vec<BatteryBucketStats<'_>> {
+    let mut buckets = Vec::new();
+    let mut run_start = 0usize;
+    let mut run_key: Option<i64> = None;
+
+    // Samples arrive sorted by timestamp (aggregate_samples_by_timestamp orders them), so
+    // buckets come out as contiguous runs and a single sweep replaces the map + per-bucket vectors.
+    for (idx, sample) in samples.iter().enumerate() {
+        let key = bucket_start_epoch(sample.ts, bucket_seconds);
+        if run_key != Some(key) {
+            if let Some(previous) = run_key {
+                buckets.push(summarize_battery_bucket(previous, &samples[run_start..idx]));
+            }
+            run_key = Some(key);
+            run_start = idx;
+        }
+    }
+    if let Some(key) = run_key {
+        buckets.push(summarize_battery_bucket(key, &samples[run_start..]));
+    }
+    // Keys use each sample's local offset, so at a DST spring-forward a span longer than the
+    // shift yields a later run whose start is earlier. Sort to keep the table chronological.
+    buckets.sort_by_key(|bucket| bucket.start);
+    buckets
+}
+
+fn summarize_battery_bucket(start: i64, bucket: &[Sample]) -> BatteryBucketStats<'_> {
+    let mut percent = NumberStats::default();
+    for sample in bucket {
+        percent.record_opt(sample.percentage);
+    }
+    BatteryBucketStats {
+        start,
+        records: bucket.len(),
+        percent,
+        latest_status: bucket.last().and_then(|s| s.status.as_deref()),
+        rates: average_rates(bucket),
+    }
+}
+
 fn battery_stats_table(
     samples: &[Sample],
-    power_draw: &BTreeMap<DateTime<Local>, NumberStats>,
+    power_draw: &Buckets<NumberStats>,
     bucket_seconds: i64,
 ) -> Table {
-    let mut buckets: BTreeMap<DateTime<Local>, Vec<&Sample>> = BTreeMap::new();
-    for sample in samples {
-        let bucket_key = bucket_start(sample.ts, bucket_seconds);
-        buckets.entry(bucket_key).or_default().push(sample);
-    }
-
     let mut report = themed_table();
     report.set_header(header_cells(&[
         "Window",
@@ -761,29 +777,21 @@ fn battery_stats_table(
         "Latest status",
     ]));
 
-    for (bucket_start, bucket_samples) in buckets {
-        let pct_values: Vec<f64> = bucket_samples.iter().filter_map(|s| s.percentage).collect();
-        let (min_pct, avg_pct, max_pct) = pct_stats(&pct_values);
-        let latest_status = bucket_samples
-            .last()
-            .and_then(|s| s.status.as_deref())
-            .unwrap_or("unknown");
-        let rates = average_rates(bucket_samples.iter().copied());
-        let draw = power_draw
-            .get(&bucket_start)
+    for stats in battery_bucket_stats(samples, bucket_seconds) {
+        let draw = bucket_get(power_draw, stats.start)
             .and_then(NumberStats::average)
-            .or(rates.discharge_w);
+            .or(stats.rates.discharge_w);
         report.add_row(vec![
-            Cell::new(format_bucket(bucket_start, bucket_seconds))
+            Cell::new(format_bucket(stats.start, bucket_seconds))
                 .fg(Color::Magenta)
                 .add_attribute(Attribute::Bold),
-            value_cell(bucket_samples.len()),
-            value_cell(min_pct),
-            value_cell(avg_pct),
-            value_cell(max_pct),
+            value_cell(stats.records),
+            value_cell(format_percent(stats.percent.min())),
+            value_cell(format_percent(stats.percent.average())),
+            value_cell(format_percent(stats.percent.max())),
             value_cell(format_power(draw)),
-            value_cell(format_power(rates.charge_w)),
-            status_cell(Some(latest_status)),
+            value_cell(format_power(stats.rates.charge_w)),
+            status_cell(Some(stats.latest_status.unwrap_or("unknown"))),
         ]);
     }
     report
@@ -810,7 +818,7 @@ fn cpu_stats_table(bucket_seconds: i64, usage: &SourceBuckets, freq: &SourceBuck
     for source in sources {
         let usage_buckets = usage.get(source);
         let freq_buckets = freq.get(source);
-        let mut keys: Vec<DateTime<Local>> = usage_buckets
+        let mut keys: Vec<i64> = usage_buckets
             .into_iter()
             .flat_map(|m| m.keys().copied())
             .chain(freq_buckets.into_iter().flat_map(|m| m.keys().copied()))
@@ -865,7 +873,7 @@ fn gpu_stats_table(bucket_seconds: i64, usage: &SourceBuckets, freq: &SourceBuck
     for source in sources {
         let usage_buckets = usage.get(source);
         let freq_buckets = freq.get(source);
-        let mut keys: Vec<DateTime<Local>> = usage_buckets
+        let mut keys: Vec<i64> = usage_buckets
             .into_iter()
             .flat_map(|m| m.keys().copied())
             .chain(freq_buckets.into_iter().flat_map(|m| m.keys().copied()))
@@ -899,10 +907,7 @@ fn gpu_stats_table(bucket_seconds: i64, usage: &SourceBuckets, freq: &SourceBuck
     report
 }
 
-fn memory_stats_table(
-    bucket_seconds: i64,
-    buckets: &BTreeMap<DateTime<Local>, UsageStats>,
-) -> Table {
+fn memory_stats_table(bucket_seconds: i64, buckets: &Buckets<UsageStats>) -> Table {
     let mut report = themed_table();
     report.set_header(header_cells(&[
         "Window",
@@ -930,7 +935,7 @@ fn memory_stats_table(
     report
 }
 
-fn disk_stats_table(bucket_seconds: i64, buckets: &BTreeMap<DateTime<Local>, UsageStats>) -> Table {
+fn disk_stats_table(bucket_seconds: i64, buckets: &Buckets<UsageStats>) -> Table {
     let mut report = themed_table();
     report.set_header(header_cells(&[
         "Window",
@@ -977,34 +982,16 @@ fn temperature_stats_table(bucket_seconds: i64, buckets: &SourceBuckets) -> Tabl
                     .fg(Color::Magenta)
                     .add_attribute(Attribute::Bold),
                 value_cell(stats.count),
-                value_cell(
-                    stats
-                        .min()
-                        .map(|v| format!("{v:.1}C"))
-                        .unwrap_or_else(|| "--".to_string()),
-                ),
-                value_cell(
-                    stats
-                        .average()
-                        .map(|v| format!("{v:.1}C"))
-                        .unwrap_or_else(|| "--".to_string()),
-                ),
-                value_cell(
-                    stats
-                        .max()
-                        .map(|v| format!("{v:.1}C"))
-                        .unwrap_or_else(|| "--".to_string()),
-                ),
+                value_cell(format_temperature(stats.min())),
+                value_cell(format_temperature(stats.average())),
+                value_cell(format_temperature(stats.max())),
             ]);
         }
     }
     report
 }
 
-fn network_stats_table(
-    bucket_seconds: i64,
-    buckets: &BTreeMap<DateTime<Local>, RateStats>,
-) -> Table {
+fn network_stats_table(bucket_seconds: i64, buckets: &Buckets<RateStats>) -> Table {
     let mut report = themed_table();
     report.set_header(header_cells(&[
         "Window",
@@ -1060,31 +1047,21 @@ fn number_from_details(sample: &MetricSample, key: &str) -> Option<f64> {
         .and_then(|v| v.as_f64().or_else(|| v.as_i64().map(|i| i as f64)))
 }
 
-fn pct_stats(values: &[f64]) -> (String, String, String) {
-    if values.is_empty() {
-        return ("--".to_string(), "--".to_string(), "--".to_string());
-    }
-    let min = values.iter().cloned().fold(f64::INFINITY, f64::min);
-    let max = values.iter().cloned().fold(f64::NEG_INFINITY, f64::max);
-    let avg = values.iter().sum::<f64>() / values.len() as f64;
-    (
-        format!("{min:.1}%"),
-        format!("{avg:.1}%"),
-        format!("{max:.1}%"),
-    )
-}
-
-fn format_bucket(dt: DateTime<Local>, bucket_seconds: i64) -> String {
+// Called once per table row; labels are cheap to build, so they are not cached.
+fn format_bucket(bucket_start: i64, bucket_seconds: i64) -> String {
+    let dt = Local.timestamp_opt(bucket_start, 0).unwrap();
+    let (month, day) = (dt.month(), dt.day());
     if bucket_seconds < 3600 {
-        dt.format("%m-%d %H:%M").to_string()
+        format!("{month:02}-{day:02} {:02}:{:02}", dt.hour(), dt.minute())
     } else if bucket_seconds < 24 * 3600 {
-        dt.format("%m-%d %H:00").to_string()
+        format!("{month:02}-{day:02} {:02}:00", dt.hour())
     } else {
+        let date = format!("{:04}-{month:02}-{day:02}", dt.year());
         let days = bucket_seconds / (24 * 3600);
         if days <= 1 {
-            dt.format("%Y-%m-%d").to_string()
+            date
         } else {
-            format!("{} (+{days}d)", dt.format("%Y-%m-%d"))
+            format!("{date} (+{days}d)")
         }
     }
 }
@@ -1170,6 +1147,23 @@ mod tests {
         assert_eq!(cpu1_count, 1);
     }
 
+    #[test]
+    fn bucket_entry_keeps_buckets_sorted() {
+        let mut buckets: Buckets<NumberStats> = Vec::new();
+        for (key, value) in [(60, 1.0), (60, 3.0), (120, 5.0), (0, 7.0), (60, 9.0)] {
+            bucket_entry(&mut buckets, key).record(value);
+        }
+
+        let keys: Vec<i64> = buckets.iter().map(|(k, _)| *k).collect();
+        assert_eq!(keys, vec![0, 60, 120]);
+        assert_eq!(bucket_get(&buckets, 60).map(|s| s.count), Some(3));
+        assert_eq!(
+            bucket_get(&buckets, 0).and_then(NumberStats::max),
+            Some(7.0)
+        );
+        assert!(bucket_get(&buckets, 30).is_none());
+    }
+
     #[test]
     fn metrics_can_be_filtered_by_source() {
         let metrics = vec![
@@ -1177,11 +1171,75 @@ mod tests {
             metric_sample_with_source(MetricKind::CpuUsage, "cpu1", 0.0, Some(20.0), json!({})),
         ];
 
-        let filtered = filter_metrics_by_source(&metrics, &["cpu1".to_string()]);
+        let filtered = filter_metrics_by_source(metrics, &["cpu1".to_string()]);
         assert_eq!(filtered.len(), 1);
         assert_eq!(filtered[0].source, "cpu1");
     }
 
+    fn battery_sample(ts: f64, percentage: Option<f64>, status: &str) -> Sample {
+        Sample {
+            ts,
+            percentage,
+            capacity_pct: None,
+            health_pct: None,
+            energy_now_wh: None,
+            energy_full_wh: None,
+            energy_full_design_wh: None,
+            status: Some(status.to_string()),
+            source_path: "BAT0".to_string(),
+        }
+    }
+
+    #[test]
+    fn battery_bucket_stats_reduce_percentages_per_bucket() {
+        let base = 1_699_999_200.0;
+        let samples = vec![
+            battery_sample(base + 1.0, Some(80.0), "Discharging"),
+            battery_sample(base + 30.0, Some(70.0), "Discharging"),
+            battery_sample(base + 45.0, None, "Charging"),
+            battery_sample(base + 1201.0, Some(60.0), "Full"),
+        ];
+
+        let buckets = battery_bucket_stats(&samples, 600);
+        assert_eq!(buckets.len(), 2);
+        assert_eq!(buckets[0].records, 3);
+        assert_eq!(buckets[0].percent.count, 2);
+        assert_eq!(buckets[0].percent.min(), Some(70.0));
+        assert_eq!(buckets[0].percent.max(), Some(80.0));
+        assert!((buckets[0].percent.average().unwrap() - 75.0).abs() < 1e-6);
+        assert_eq!(buckets[0].latest_status, Some("Charging"));
+        assert_eq!(buckets[1].records, 1);
+        assert_eq!(buckets[1].latest_status, Some("Full"));
+    }
+
+    #[test]
+    fn format_bucket_matches_strftime_layouts() {
+        let start = bucket_start_epoch(1_700_000_000.0, 300);
+        let dt = Local.timestamp_opt(start, 0).unwrap();
+        assert_eq!(
+            format_bucket(start, 300),
+            dt.format("%m-%d %H:%M").to_string()
+        );
+        assert_eq!(
+            format_bucket(start, 3600),
+            dt.format("%m-%d %H:00").to_string()
+        );
+        assert_eq!(
+            format_bucket(start, 24 * 3600),
+            dt.format("%Y-%m-%d").to_string()
+        );
+        assert_eq!(
+            format_bucket(start, 3 * 24 * 3600),
+            format!("{} (+3d)", dt.format("%Y-%m-%d"))
+        );
+    }
+
+    #[test]
+    fn format_temperature_uses_one_decimal() {
+        assert_eq!(format_temperature(Some(51.04)), "51.0C");
+        assert_eq!(format_temperature(None), "--");
+    }
+
     #[test]
     fn usage_stats_compute_percentage() {
         let metrics = vec![metric_sample(
@@ -61,14 +61,64 @@ pub fn bucket_span_seconds(timeframe: &Timeframe, data_span_seconds: Option<f64>
     }
 }
 
+pub fn bucket_start_epoch(ts: f64, bucket_seconds: i64) -> i64 {
+    let seconds = ts as i64;
+    let offset_seconds = i64::from(
+        Local
+            .timestamp_opt(seconds, 0)
+            .unwrap()
+            .offset()
+            .local_minus_utc(),
+    );
+    let local_seconds = seconds + offset_seconds;
+    let bucket_epoch = local_seconds.div_euclid(bucket_seconds) * bucket_seconds - offset_seconds;
+    bucket_epoch.max(0)
+}
+
 pub fn bucket_start(ts: f64, bucket_seconds: i64) -> DateTime<Local> {
-    let local_dt = Local.timestamp_opt(ts as i64, 0).unwrap();
-    let offset_seconds = -local_dt.offset().utc_minus_local(); // convert to python-style offset
-    let bucket_epoch = (((ts + offset_seconds as f64) / bucket_seconds as f64).floor()
-        * bucket_seconds as f64)
-        - offset_seconds as f64;
-    let aligned = bucket_epoch.max(0.0) as i64;
-    Local.timestamp_opt(aligned, 0).unwrap()
+    Local
+        .timestamp_opt(bucket_start_epoch(ts, bucket_seconds), 0)
+        .unwrap()
+}
+
+#[derive(Default, Clone)]
+pub struct NumberStats {
+    total: f64,
+    pub count: usize,
+    min: f64,
+    max: f64,
+}
+
+impl NumberStats {
+    pub fn record(&mut self, value: f64) {
+        if self.count == 0 {
+            self.min = value;
+            self.max = value;
+        } else {
+            self.min = self.min.min(value);
+            self.max = self.max.max(value);
+        }
+        self.total += value;
+        self.count += 1;
+    }
+
+    pub fn record_opt(&mut self, value: Option<f64>) {
+        if let Some(v) = value {
+            self.record(v);
+        }
+    }
+
+    pub fn average(&self) -> Option<f64> {
+        (self.count > 0).then_some(self.total / self.count as f64)
+    }
+
+    pub fn min(&self) -> Option<f64> {
+        (self.count > 0).then_some(self.min)
+    }
+
+    pub fn max(&self) -> Option<f64> {
+        (self.count > 0).then_some(self.max)
+    }
 }
 
 #[derive(Debug, Default, PartialEq)]
@@ -98,14 +148,34 @@ impl RateAccumulator {
     }
 }
 
+/// Per-sample inputs for rate estimation, with the status classified once.
+#[derive(Clone, Copy)]
+struct RatePoint {
+    ts: f64,
+    energy_wh: f64,
+    charging: bool,
+    discharging: bool,
+}
+
+impl RatePoint {
+    fn from_sample(sample: &Sample) -> Option<Self> {
+        Some(RatePoint {
+            ts: sample.ts,
+            energy_wh: sample.energy_now_wh?,
+            charging: is_charging(sample),
+            discharging: is_discharging(sample),
+        })
+    }
+}
+
 pub fn average_rates<'a>(samples: impl IntoIterator<Item = &'a Sample>) -> AverageRates {
     const MAX_GAP_HOURS: f64 = 5.0 / 60.0;
 
     let mut discharge = RateAccumulator::default();
     let mut charge = RateAccumulator::default();
-    let mut iter = samples.into_iter().filter(|s| s.energy_now_wh.is_some());
+    let mut iter = samples.into_iter().filter_map(RatePoint::from_sample);
     let mut previous = match iter.next() {
-        Some(sample) => sample,
+        Some(point) => point,
         None => return AverageRates::default(),
     };
 
@@ -116,10 +186,10 @@ pub fn average_rates<'a>(samples: impl IntoIterator<Item = &'a Sample>) -> Avera
         }
         let dt_hours = (current.ts - previous.ts) / 3600.0;
         if dt_hours > 0.0 && dt_hours <= MAX_GAP_HOURS {
-            let delta = current.energy_now_wh.unwrap() - previous.energy_now_wh.unwrap();
-            if delta > 0.0 && is_charging(previous) && is_charging(current) {
+            let delta = current.energy_wh - previous.energy_wh;
+            if delta > 0.0 && previous.charging && current.charging {
                 charge.record(delta, dt_hours);
-            } else if delta < 0.0 && is_discharging(previous) && is_discharging(current) {
+            } else if delta < 0.0 && previous.discharging && current.discharging {
                 discharge.record(-delta, dt_hours);
             }
         }
@@ -325,6 +395,17 @@ mod tests {
         assert_eq!(bucket_day.second(), 0);
     }
 
+    #[test]
+    fn bucket_start_epoch_contains_timestamp() {
+        for ts in [1_700_000_000.0, 1_700_000_599.9, 1_710_000_123.4] {
+            for span in [5 * 60, 3600, 24 * 3600] {
+                let start = bucket_start_epoch(ts, span);
+                assert!(start as f64 <= ts && ts < (start + span) as f64);
+                assert_eq!(bucket_start(ts, span).timestamp(), start);
+            }
+        }
+    }
+
     #[test]
     fn short_timeframes_use_five_minute_buckets() {
         use crate::timeframe::build_timeframe;
@@ -1,6 +1,6 @@
 use std::path::{Path, PathBuf};
 use std::thread;
-use std::time::{Duration, SystemTime, UNIX_EPOCH};
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 use anyhow::Result;
 use log::{info, warn};
@@ -82,9 +82,23 @@ pub fn collect_loop(
     db_path: Option<&Path>,
     sysfs_root: Option<&Path>,
 ) -> Result<()> {
+    let interval = Duration::from_secs(interval_seconds);
+    let mut deadline = Instant::now();
     loop {
         let _ = collect_once(db_path, sysfs_root)?;
-        thread::sleep(Duration::from_secs(interval_seconds));
+        deadline = next_deadline(deadline, Instant::now(), interval);
+        thread::sleep(deadline.saturating_duration_since(Instant::now()));
+    }
+}
+
+// Keep a fixed cadence from the previous deadline; after an overrun, restart from now
+// instead of firing a burst of catch-up collections.
+fn next_deadline(previous: Instant, now: Instant, interval: Duration) -> Instant {
+    let next = previous + interval;
+    if next > now {
+        next
+    } else {
+        now + interval
     }
 }
 
@@ -116,6 +130,18 @@ mod tests {
         }
     }
 
+    #[test]
+    fn next_deadline_keeps_cadence_and_recovers_from_overruns() {
+        let start = Instant::now();
+        let interval = Duration::from_secs(60);
+
+        let on_time = next_deadline(start, start + Duration::from_secs(2), interval);
+        assert_eq!(on_time, start + interval);
+
+        let late = start + Duration::from_secs(90);
+        assert_eq!(next_deadline(start, late, interval), late + interval);
+    }
+
     #[test]
     fn resolve_db_path_prefers_argument() {
         let _guard = EnvGuard::set("BATTERY_MONITOR_DB", "/tmp/should_not_use.db");
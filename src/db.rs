@@ -4,7 +4,8 @@ use std::time::{SystemTime, UNIX_EPOCH};
 use std::{collections::HashSet, str::FromStr};
 
 use anyhow::Result;
-use rusqlite::{params, Connection, Row};
+use rusqlite::types::Value;
+use rusqlite::{params, params_from_iter, Connection, Row};
 
 use crate::metrics::{MetricKind, MetricSample};
 use crate::sysfs::BatteryReading;
@@ -203,6 +204,16 @@ pub fn insert_all_samples(
     Ok(())
 }
 
+pub fn has_records(db_path: &Path) -> Result<bool> {
+    let conn = Connection::open(db_path)?;
+    let exists: bool = conn.query_row(
+        "SELECT EXISTS(SELECT 1 FROM samples) OR EXISTS(SELECT 1 FROM metric_samples)",
+        [],
+        |row| row.get(0),
+    )?;
+    Ok(exists)
+}
+
 pub fn count_samples(db_path: &Path, since_ts: Option<f64>) -> Result<usize> {
     let conn = Connection::open(db_path)?;
     let count: i64 = match since_ts {
@@ -303,30 +314,39 @@ pub fn fetch_samples(db_path: &Path, since_ts: Option<f64>) -> Result<Vec<Sample
     Ok(samples)
 }
 
+fn metric_filter_clause(
+    since_ts: Option<f64>,
+    kinds: Option<&[MetricKind]>,
+) -> (String, Vec<Value>) {
+    let mut clauses = Vec::new();
+    let mut values = Vec::new();
+    if let Some(ts) = since_ts {
+        clauses.push("ts >= ?".to_string());
+        values.push(Value::Real(ts));
+    }
+    if let Some(filter) = kinds {
+        clauses.push(format!("kind IN ({})", vec!["?"; filter.len()].join(", ")));
+        values.extend(filter.iter().map(|k| Value::Text(k.as_str().to_string())));
+    }
+    if clauses.is_empty() {
+        (String::new(), values)
+    } else {
+        (format!(" WHERE {}", clauses.join(" AND ")), values)
+    }
+}
+
 pub fn fetch_metric_samples(
     db_path: &Path,
     since_ts: Option<f64>,
     kinds: Option<&[MetricKind]>,
 ) -> Result<Vec<MetricSample>> {
     let conn = Connection::open(db_path)?;
-    let mut stmt = conn.prepare(if since_ts.is_some() {
-        "SELECT * FROM metric_samples WHERE ts >= ? ORDER BY ts"
-    } else {
-        "SELECT * FROM metric_samples ORDER BY ts"
-    })?;
-    let rows = match since_ts {
-        Some(ts) => stmt.query_map(params![ts], metric_from_row)?,
-        None => stmt.query_map([], metric_from_row)?,
-    };
+    let (filter, values) = metric_filter_clause(since_ts, kinds);
+    let mut stmt = conn.prepare(&format!("SELECT * FROM metric_samples{filter} ORDER BY ts"))?;
+    let rows = stmt.query_map(params_from_iter(values.iter()), metric_from_row)?;
     let mut samples = Vec::new();
     for row in rows {
-        let sample = row?;
-        if let Some(filter) = kinds {
-            if !filter.contains(&sample.kind) {
-                continue;
-            }
-        }
-        samples.push(sample);
+        samples.push(row?);
     }
     Ok(samples)
 }
@@ -336,17 +356,15 @@ pub fn fetch_latest_metric_samples(
     kinds: Option<&[MetricKind]>,
 ) -> Result<Vec<MetricSample>> {
     let conn = Connection::open(db_path)?;
-    let mut stmt = conn.prepare("SELECT * FROM metric_samples ORDER BY ts DESC")?;
-    let rows = stmt.query_map([], metric_from_row)?;
+    let (filter, values) = metric_filter_clause(None, kinds);
+    let mut stmt = conn.prepare(&format!(
+        "SELECT * FROM metric_samples{filter} ORDER BY ts DESC"
+    ))?;
+    let rows = stmt.query_map(params_from_iter(values.iter()), metric_from_row)?;
     let mut seen: HashSet<(MetricKind, String)> = HashSet::new();
     let mut samples = Vec::new();
     for row in rows {
         let sample = row?;
-        if let Some(filter) = kinds {
-            if !filter.contains(&sample.kind) {
-                continue;
-            }
-        }
         let key = (sample.kind.clone(), sample.source.clone());
         if seen.insert(key) {
             samples.push(sample);
@@ -558,6 +576,25 @@ mod tests {
         assert_eq!(fetch_metric_samples(&db_path, None, None).unwrap().len(), 1);
     }
 
+    #[test]
+    fn has_records_checks_both_tables() {
+        let tmp = tempfile::tempdir().unwrap();
+        let db_path = tmp.path().join("empty.db");
+        init_db(&db_path).unwrap();
+        assert!(!has_records(&db_path).unwrap());
+
+        let metric = MetricSample {
+            ts: 1.0,
+            kind: MetricKind::CpuUsage,
+            source: "cpu".to_string(),
+            value: Some(5.0),
+            unit: Some("%".to_string()),
+            details: serde_json::Value::Null,
+        };
+        insert_metric_samples(&db_path, &[metric]).unwrap();
+        assert!(has_records(&db_path).unwrap());
+    }
+
     #[test]
     fn event_helpers_group_by_timestamp() {
         let tmp = tempfile::tempdir().unwrap();
@@ -670,5 +707,13 @@ mod tests {
         assert_eq!(latest.len(), 2);
         assert_eq!(latest[0].source, "cpu");
         assert_eq!(latest[0].value, Some(50.0));
+
+        let latest_network =
+            fetch_latest_metric_samples(&db_path, Some(&[MetricKind::NetworkBytes])).unwrap();
+        assert_eq!(latest_network.len(), 1);
+        assert_eq!(latest_network[0].source, "eth0");
+        assert!(fetch_metric_samples(&db_path, None, Some(&[]))
+            .unwrap()
+            .is_empty());
     }
 }
@@ -11,6 +11,7 @@ use plotters::series::LineSeries;
 
 use crate::aggregate::aggregate_samples_by_timestamp;
 use crate::cli::ReportPreset;
+use crate::cli_helpers::NumberStats;
 use crate::db::{self, Sample};
 use crate::metrics::{MetricKind, MetricSample};
 use crate::timeframe::Timeframe;
@@ -215,25 +216,41 @@ fn build_charts(
     charts
 }
 
-fn plot_chart(area: DrawingArea<BitMapBackend, Shift>, chart: &ChartSpec) -> Result<()> {
-    let mut all_points: Vec<(DateTime<Utc>, f64)> = Vec::new();
-    for series in &chart.series {
-        all_points.extend_from_slice(&series.points);
-    }
+struct ChartBounds {
+    min_ts: DateTime<Utc>,
+    max_ts: DateTime<Utc>,
+    min_y: f64,
+    max_y: f64,
+}
 
-    let Some(min_ts) = all_points.iter().map(|(ts, _)| *ts).min() else {
-        return Ok(());
+fn chart_bounds(series: &[MetricSeries]) -> Option<ChartBounds> {
+    let mut points = series.iter().flat_map(|s| s.points.iter());
+    let &(first_ts, first_value) = points.next()?;
+    let mut bounds = ChartBounds {
+        min_ts: first_ts,
+        max_ts: first_ts,
+        min_y: first_value,
+        max_y: first_value,
     };
-    let Some(max_ts) = all_points.iter().map(|(ts, _)| *ts).max() else {
+    for &(ts, value) in points {
+        bounds.min_ts = bounds.min_ts.min(ts);
+        bounds.max_ts = bounds.max_ts.max(ts);
+        bounds.min_y = bounds.min_y.min(value);
+        bounds.max_y = bounds.max_y.max(value);
+    }
+    Some(bounds)
+}
+
+fn plot_chart(area: DrawingArea<BitMapBackend, Shift>, chart: &ChartSpec) -> Result<()> {
+    let Some(ChartBounds {
+        min_ts,
+        max_ts,
+        mut min_y,
+        mut max_y,
+    }) = chart_bounds(&chart.series)
+    else {
         return Ok(());
     };
-
-    let mut min_y = f64::INFINITY;
-    let mut max_y = f64::NEG_INFINITY;
-    for (_, value) in &all_points {
-        min_y = min_y.min(*value);
-        max_y = max_y.max(*value);
-    }
     if (max_y - min_y).abs() < 1e-6 {
         min_y -= 1.0;
         max_y += 1.0;
@@ -261,7 +278,7 @@ fn plot_chart(area: DrawingArea<BitMapBackend, Shift>, chart: &ChartSpec) -> Res
     for (idx, series) in chart.series.iter().enumerate() {
         let color = Palette99::pick(idx).to_rgba();
         chart_ctx
-            .draw_series(LineSeries::new(series.points.clone(), &color))?
+            .draw_series(LineSeries::new(series.points.iter().copied(), &color))?
             .label(series.label.clone())
             .legend(move |(x, y)| PathElement::new(vec![(x, y), (x + 10, y)], color));
     }
@@ -297,23 +314,20 @@ fn aggregate_metric_series<F>(
 where
     F: FnMut(f64, &MetricSample) -> f64,
 {
-    let mut grouped: BTreeMap<OrderedFloat<f64>, Vec<f64>> = BTreeMap::new();
+    let mut grouped: BTreeMap<OrderedFloat<f64>, NumberStats> = BTreeMap::new();
     for sample in metrics.iter().filter(|m| m.kind == kind) {
         if let Some(value) = sample.value {
             grouped
                 .entry(OrderedFloat(sample.ts))
                 .or_default()
-                .push(map_value(value, sample));
+                .record(map_value(value, sample));
         }
     }
 
     grouped
         .into_iter()
-        .filter_map(|(ts, values)| {
-            if values.is_empty() {
-                return None;
-            }
-            let avg = values.iter().sum::<f64>() / values.len() as f64;
+        .filter_map(|(ts, acc)| {
+            let avg = acc.average()?;
             ts_to_datetime(ts.into_inner()).map(|dt| (dt, avg))
         })
         .collect()
@@ -327,33 +341,30 @@ fn aggregate_metric_series_by_source<F>(
 where
     F: FnMut(f64, &MetricSample) -> f64,
 {
-    let mut grouped: BTreeMap<String, BTreeMap<OrderedFloat<f64>, Vec<f64>>> = BTreeMap::new();
+    let mut grouped: BTreeMap<&str, BTreeMap<OrderedFloat<f64>, NumberStats>> = BTreeMap::new();
     for sample in metrics.iter().filter(|m| m.kind == kind) {
         if let Some(value) = sample.value {
             grouped
-                .entry(sample.source.clone())
+                .entry(sample.source.as_str())
                 .or_default()
                 .entry(OrderedFloat(sample.ts))
                 .or_default()
-                .push(map_value(value, sample));
+                .record(map_value(value, sample));
         }
     }
 
     let mut series = Vec::new();
     for (source, buckets) in grouped {
-        let mut points = Vec::new();
-        for (ts, values) in buckets {
-            if values.is_empty() {
-                continue;
-            }
-            let avg = values.iter().sum::<f64>() / values.len() as f64;
-            if let Some(dt) = ts_to_datetime(ts.into_inner()) {
-                points.push((dt, avg));
-            }
-        }
+        let points: SeriesPoints = buckets
+            .into_iter()
+            .filter_map(|(ts, acc)| {
+                let avg = acc.average()?;
+                ts_to_datetime(ts.into_inner()).map(|dt| (dt, avg))
+            })
+            .collect();
         if !points.is_empty() {
             series.push(MetricSeries {
-                label: source,
+                label: source.to_string(),
                 points,
             });
         }
@@ -447,6 +458,28 @@ mod tests {
         }
     }
 
+    #[test]
+    fn chart_bounds_span_all_series() {
+        let at = |secs: i64| Utc.timestamp_opt(secs, 0).unwrap();
+        let series = vec![
+            MetricSeries {
+                label: "a".to_string(),
+                points: vec![(at(10), 5.0), (at(20), -1.0)],
+            },
+            MetricSeries {
+                label: "b".to_string(),
+                points: vec![(at(5), 3.0), (at(15), 9.0)],
+            },
+        ];
+
+        let bounds = chart_bounds(&series).unwrap();
+        assert_eq!(bounds.min_ts, at(5));
+        assert_eq!(bounds.max_ts, at(20));
+        assert_eq!(bounds.min_y, -1.0);
+        assert_eq!(bounds.max_y, 9.0);
+        assert!(chart_bounds(&[]).is_none());
+    }
+
     #[test]
     fn aggregate_metric_series_is_per_source() {
         let metrics = vec![